@@ -1,127 +1,131 @@
 """Async usage examples for Zaban Python client."""
 
-import asyncio
+import functools
+
+from helpers import gather_or_cancel, run
 
 from zaban import AsyncZaban
 
+# API Key - Option 1: Set directly here
+API_KEY = "sk-your-api-key"
+# Option 2: Use environment variable (set ZABAN_API_KEY)
+# API_KEY = None
+
 
-async def single_translation():
+async def single_translation(client: AsyncZaban):
     """Example: Single async translation."""
     print("=== Single Async Translation ===\n")
 
-    async with AsyncZaban(api_key="Your_ZABAN_API_KEY") as client:
-        result = await client.translation.create(
-            text="Hello, world!", target_lang="hin_Deva", auto_detect=True
-        )
-        print("Original: Hello, world!")
-        print(f"Translated: {result.translated_text}\n")
+    result = await client.translation.create(
+        text="Hello, world!", target_lang="hin_Deva", auto_detect=True
+    )
+    print("Original: Hello, world!")
+    print(f"Translated: {result.translated_text}\n")
 
 
-async def batch_translations():
+async def batch_translations(client: AsyncZaban):
     """Example: Batch translations with concurrent requests."""
     print("=== Batch Translations ===\n")
 
-    async with AsyncZaban(api_key="sk-your-api-key") as client:
-        # Prepare multiple texts
-        texts = [
-            "Hello",
-            "Goodbye",
-            "Thank you",
-            "Good morning",
-            "How are you?",
-        ]
-
-        # Create concurrent translation tasks
-        tasks = [
-            client.translation.create(text=text, target_lang="hin_Deva", auto_detect=True)
-            for text in texts
-        ]
-
-        # Execute all tasks concurrently
-        results = await asyncio.gather(*tasks)
+    # Prepare multiple texts
+    texts = [
+        "Hello",
+        "Goodbye",
+        "Thank you",
+        "Good morning",
+        "How are you?",
+    ]
+
+    # Create concurrent translation tasks
+    tasks = [
+        client.translation.create(text=text, target_lang="hin_Deva", auto_detect=True)
+        for text in texts
+    ]
+
+    # Execute all tasks concurrently
+    results = await gather_or_cancel(*tasks)
+
+    # Print results with a single write
+    lines = [
+        f"{original:20} -> {result.translated_text}" for original, result in zip(texts, results)
+    ]
+    print("\n".join(lines))
 
-        # Print results
-        for original, result in zip(texts, results):
-            print(f"{original:20} -> {result.translated_text}")
-
-        print()
+    print()
 
 
-async def multi_language_translation():
+async def multi_language_translation(client: AsyncZaban):
     """Example: Translate one text to multiple languages."""
     print("=== Multi-Language Translation ===\n")
 
-    async with AsyncZaban(api_key="sk-your-api-key") as client:
-        text = "Good morning"
-        target_languages = [
-            ("hin_Deva", "Hindi"),
-            ("tam_Taml", "Tamil"),
-            ("ben_Beng", "Bengali"),
-            ("tel_Telu", "Telugu"),
-            ("guj_Gujr", "Gujarati"),
-        ]
-
-        # Create concurrent tasks
-        tasks = [
-            client.translation.create(text=text, target_lang=lang_code, auto_detect=True)
-            for lang_code, _ in target_languages
-        ]
-
-        # Execute all tasks
-        results = await asyncio.gather(*tasks)
-
-        # Print results
-        print(f"Original: {text}\n")
-        for (_, lang_name), result in zip(target_languages, results):
-            print(f"{lang_name:12} -> {result.translated_text}")
+    text = "Good morning"
+    target_languages = [
+        ("hin_Deva", "Hindi"),
+        ("tam_Taml", "Tamil"),
+        ("ben_Beng", "Bengali"),
+        ("tel_Telu", "Telugu"),
+        ("guj_Gujr", "Gujarati"),
+    ]
+
+    # Create concurrent tasks; only target_lang varies per call
+    translate_to = functools.partial(client.translation.create, text=text, auto_detect=True)
+    tasks = [translate_to(target_lang=lang_code) for lang_code, _ in target_languages]
+
+    # Execute all tasks
+    results = await gather_or_cancel(*tasks)
+
+    # Print results
+    print(f"Original: {text}\n")
+    lines = [
+        f"{lang_name:12} -> {result.translated_text}"
+        for (_, lang_name), result in zip(target_languages, results)
+    ]
+    print("\n".join(lines))
 
-        print()
+    print()
 
 
-async def tts_async():
+async def tts_async(client: AsyncZaban):
     """Example: Async text-to-speech."""
     print("=== Async Text-to-Speech ===\n")
 
-    async with AsyncZaban(api_key="sk-your-api-key") as client:
-        audio = await client.audio.speech.create(text="नमस्ते दुनिया", lang="hi", speaker="female")
+    audio = await client.audio.speech.create(text="नमस्ते दुनिया", lang="hi", speaker="female")
 
-        audio.save("async_output.wav")
-        print("Audio saved to: async_output.wav\n")
+    audio.save("async_output.wav")
+    print("Audio saved to: async_output.wav\n")
 
 
-async def stt_async():
+async def stt_async(client: AsyncZaban):
     """Example: Async speech-to-text."""
     print("=== Async Speech-to-Text ===\n")
 
-    async with AsyncZaban(api_key="sk-your-api-key") as client:
-        try:
-            transcription = await client.audio.transcriptions.create(audio="audio.wav", lang="hi")
-            print(f"Transcribed: {transcription.text}\n")
-        except Exception as e:
-            print(f"Error: {e}")
-            print("(Make sure you have an audio file at 'audio.wav')\n")
+    try:
+        transcription = await client.audio.transcriptions.create(audio="audio.wav", lang="hi")
+        print(f"Transcribed: {transcription.text}\n")
+    except Exception as e:
+        print(f"Error: {e}")
+        print("(Make sure you have an audio file at 'audio.wav')\n")
 
 
-async def transliteration_async():
+async def transliteration_async(client: AsyncZaban):
     """Example: Async transliteration."""
     print("=== Async Transliteration ===\n")
 
-    async with AsyncZaban(api_key="sk-your-api-key") as client:
-        words = ["namaste", "dhanyavaad", "shukriya"]
+    words = ["namaste", "dhanyavaad", "shukriya"]
 
-        tasks = [
-            client.transliteration.create(
-                text=word, source_script="latn", target_script="deva", lang="hi"
-            )
-            for word in words
-        ]
+    tasks = [
+        client.transliteration.create(
+            text=word, source_script="latn", target_script="deva", lang="hi"
+        )
+        for word in words
+    ]
 
-        results = await asyncio.gather(*tasks)
+    results = await gather_or_cancel(*tasks)
 
-        for original, result in zip(words, results):
-            print(f"{original:15} -> {result.top}")
+    lines = [f"{original:15} -> {result.top}" for original, result in zip(words, results)]
+    print("\n".join(lines))
 
-        print()
+    print()
 
 
 async def error_handling_async():
@@ -141,26 +145,25 @@ async def error_handling_async():
     print()
 
 
-async def mixed_operations():
+async def mixed_operations(client: AsyncZaban):
     """Example: Mix different operations concurrently."""
     print("=== Mixed Concurrent Operations ===\n")
 
-    async with AsyncZaban(api_key="sk-your-api-key") as client:
-        # Create different types of tasks
-        translation_task = client.translation.create(
-            text="Hello", target_lang="hin_Deva", auto_detect=True
-        )
+    # Create different types of tasks
+    translation_task = client.translation.create(
+        text="Hello", target_lang="hin_Deva", auto_detect=True
+    )
 
-        transliteration_task = client.transliteration.create(
-            text="namaste", source_script="latn", target_script="deva", lang="hi"
-        )
+    transliteration_task = client.transliteration.create(
+        text="namaste", source_script="latn", target_script="deva", lang="hi"
+    )
 
-        # Execute concurrently
-        translation, transliteration = await asyncio.gather(translation_task, transliteration_task)
+    # Execute concurrently
+    translation, transliteration = await gather_or_cancel(translation_task, transliteration_task)
 
-        print(f"Translation: Hello -> {translation.translated_text}")
-        print(f"Transliteration: namaste -> {transliteration.top}")
-        print()
+    print(f"Translation: Hello -> {translation.translated_text}")
+    print(f"Transliteration: namaste -> {transliteration.top}")
+    print()
 
 
 async def main():
@@ -169,14 +172,17 @@ async def main():
     print("=" * 50 + "\n")
 
     try:
-        await single_translation()
-        await batch_translations()
-        await multi_language_translation()
-        # await tts_async()
-        # await stt_async()
-        await transliteration_async()
+        # One client for the whole application, so all examples share its
+        # connection pool instead of reconnecting for each call
+        async with AsyncZaban(api_key=API_KEY) as client:
+            await single_translation(client)
+            await batch_translations(client)
+            await multi_language_translation(client)
+            # await tts_async(client)
+            # await stt_async(client)
+            await transliteration_async(client)
+            await mixed_operations(client)
         # await error_handling_async()
-        await mixed_operations()
     except Exception as e:
         print(f"Error: {e}")
         print("\nMake sure you have set your API key:")
@@ -184,4 +190,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main)
@@ -1,12 +1,16 @@
 """Batch translation examples for processing large amounts of text."""
 
 import asyncio
+import functools
 import io
 import sys
 import time
-from typing import List, Tuple
+from typing import List, Optional, Set, Tuple
 
-from zaban import AsyncZaban
+from helpers import gather_or_cancel, run
+
+from zaban import APIError, AsyncZaban, ValidationError
+from zaban.types import TranslationRequest, TranslationResponse
 
 # Fix Windows console encoding for Unicode
 if sys.platform == "win32":
@@ -18,172 +22,424 @@ API_KEY = "Your_ZABAN_API_KEY"
 # API_KEY = None
 
 
-async def translate_file(
-    client: AsyncZaban, input_file: str, output_file: str, target_lang: str, batch_size: int = 10
-):
-    """Translate a text file line by line.
+async def translate_items(
+    client: AsyncZaban, items: List[TranslationRequest]
+) -> List[TranslationResponse]:
+    """Translate requests with a single batch request.
+
+    Falls back to one request per item if the server rejects the batch
+    endpoint with a 4xx error (e.g. an older server without it).
 
     Args:
         client: AsyncZaban client
-        input_file: Path to input file
-        output_file: Path to output file
-        target_lang: Target language code
-        batch_size: Number of concurrent translations
+        items: Translation requests
+
+    Returns:
+        Translation results in the same order as items
     """
-    print(f"Translating {input_file} to {target_lang}...\n")
+    try:
+        return await client.translation.create_batch(items)
+    except (APIError, ValidationError) as e:
+        if e.status_code is None or not 400 <= e.status_code < 500:
+            raise
 
-    # Read input file
-    with open(input_file, encoding="utf-8") as f:
-        lines = f.readlines()
+    tasks = [client.translation.create(**item.model_dump()) for item in items]
+    return await gather_or_cancel(*tasks)
 
-    total_lines = len(lines)
-    translated_lines = []
 
-    # Process in batches
-    for i in range(0, total_lines, batch_size):
-        batch = lines[i : i + batch_size]
+class BatchQueue:
+    """Coalesce individual translations into batch requests.
+
+    Each add() call joins a pending batch, which is sent once it holds
+    ``max_items`` texts or ``max_chars`` characters, or ``max_delay`` seconds
+    after its first item arrived. Short texts then share one request's
+    HTTP, JSON and auth overhead instead of paying it each.
+    """
+
+    def __init__(
+        self,
+        client: AsyncZaban,
+        *,
+        max_items: int = 10,
+        max_chars: int = 5000,
+        max_delay: float = 0.05,
+    ):
+        self._client = client
+        self.max_items = max_items
+        self.max_chars = max_chars
+        self.max_delay = max_delay
+        self._pending: List[Tuple[TranslationRequest, asyncio.Future[TranslationResponse]]] = []
+        self._pending_chars = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._sending: Set[asyncio.Task[None]] = set()
+
+    async def add(self, request: TranslationRequest) -> TranslationResponse:
+        """Queue a translation and wait for the batch it is sent in."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((request, future))
+        self._pending_chars += len(request.text)
+
+        if len(self._pending) >= self.max_items or self._pending_chars >= self.max_chars:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+
+        return await future
+
+    def close(self) -> None:
+        """Cancel batches that are pending or being sent."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        for _, future in self._pending:
+            future.cancel()
+        self._pending, self._pending_chars = [], 0
+
+        for task in self._sending:
+            task.cancel()
+
+    def _flush(self) -> None:
+        """Send the pending batch in the background."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending, self._pending_chars = self._pending, [], 0
+        if batch:
+            # Keep a reference so the task isn't garbage collected mid-flight
+            task = asyncio.ensure_future(self._send(batch))
+            self._sending.add(task)
+            task.add_done_callback(self._sending.discard)
+
+    async def _send(
+        self, batch: List[Tuple[TranslationRequest, "asyncio.Future[TranslationResponse]"]]
+    ) -> None:
+        """Translate a batch and resolve each caller's future."""
+        try:
+            results = await translate_items(self._client, [request for request, _ in batch])
+        except BaseException as e:
+            # Resolve every waiter, even on cancellation, so no add() hangs
+            for _, future in batch:
+                if future.done():
+                    continue
+                if isinstance(e, Exception):
+                    future.set_exception(e)
+                else:
+                    future.cancel()
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        # Callers that were cancelled meanwhile have already-done futures
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
 
-        # Create tasks for batch
-        tasks = [
-            client.translation.create(text=line.strip(), target_lang=target_lang, auto_detect=True)
-            for line in batch
-            if line.strip()
-        ]
 
-        # Execute batch
-        results = await asyncio.gather(*tasks)
+async def translate_file(
+    client: AsyncZaban,
+    input_file: str,
+    output_file: str,
+    target_lang: str,
+    batch_size: int = 10,
+    concurrency: int = 4,
+):
+    """Translate a text file line by line.
 
-        # Collect results
-        for result in results:
-            translated_lines.append(result.translated_text + "\n")
+    Lines are streamed through a reader -> workers -> writer pipeline, so memory
+    use stays bounded and output is written as soon as the next batch in order
+    is ready. Workers submit lines to a shared BatchQueue, which packs short
+    lines from all workers into batch requests.
 
-        print(f"Processed {min(i + batch_size, total_lines)}/{total_lines} lines")
+    Args:
+        client: AsyncZaban client
+        input_file: Path to input file
+        output_file: Path to output file
+        target_lang: Target language code
+        batch_size: Maximum number of lines per batch request
+        concurrency: Number of line batches being translated at once
+    """
+    print(f"Translating {input_file} to {target_lang}...\n")
 
-    # Write output file
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.writelines(translated_lines)
+    queue = BatchQueue(client, max_items=batch_size)
+
+    # Bounded input queue applies backpressure to the reader
+    batches: asyncio.Queue = asyncio.Queue(maxsize=2 * concurrency)
+    translated: asyncio.Queue = asyncio.Queue()
+
+    async def read_batches():
+        with open(input_file, encoding="utf-8") as f:
+            index = 0
+            batch: List[str] = []
+            for line in f:
+                # Strip once here; workers use the stripped text as-is
+                batch.append(line.strip())
+                if len(batch) == batch_size:
+                    await batches.put((index, batch))
+                    index += 1
+                    batch = []
+            if batch:
+                await batches.put((index, batch))
+
+        # One stop signal per worker
+        for _ in range(concurrency):
+            await batches.put(None)
+
+    async def translate_batches():
+        while True:
+            job = await batches.get()
+            if job is None:
+                return
+            index, texts = job
+            # Repeated lines in a request are sent once (and, with the client
+            # cache enabled, lines seen in earlier requests are not sent at all)
+            nonempty = [i for i, text in enumerate(texts) if text]
+            results = await gather_or_cancel(
+                *[
+                    queue.add(
+                        TranslationRequest(text=texts[i], target_lang=target_lang, auto_detect=True)
+                    )
+                    for i in nonempty
+                ]
+            )
+            # Blank lines stay blank so the output lines up with the input
+            lines = [""] * len(texts)
+            for i, result in zip(nonempty, results):
+                lines[i] = result.translated_text
+            await translated.put((index, lines))
+
+    async def write_batches():
+        # Batches finish out of order; hold them until every earlier batch is written
+        pending = {}
+        next_index = 0
+        processed = 0
+        with open(output_file, "w", encoding="utf-8") as f:
+            while True:
+                done = await translated.get()
+                if done is None:
+                    return
+                index, lines = done
+                pending[index] = lines
+                while next_index in pending:
+                    lines = pending.pop(next_index)
+                    f.write("\n".join(lines) + "\n")
+                    processed += len(lines)
+                    next_index += 1
+
+                # Overwrite one progress line instead of printing a line per batch
+                print(f"Processed {processed} lines", end="\r")
+
+    async def produce_batches():
+        await gather_or_cancel(read_batches(), *[translate_batches() for _ in range(concurrency)])
+        await translated.put(None)
+
+    # Run the writer alongside the other stages so a write error (e.g. an
+    # unwritable output path) stops translation straight away
+    try:
+        await gather_or_cancel(produce_batches(), write_batches())
+    finally:
+        # Don't leave batches running after the pipeline has stopped
+        queue.close()
 
-    print(f"\nTranslation complete! Output saved to {output_file}\n")
+    print(f"\n\nTranslation complete! Output saved to {output_file}\n")
 
 
 async def translate_dataset(
-    texts: List[str], target_langs: List[str], batch_size: int = 10
+    client: AsyncZaban,
+    texts: List[str],
+    target_langs: List[str],
+    batch_size: int = 10,
+    concurrency: int = 4,
 ) -> List[Tuple[str, str, str]]:
     """Translate a dataset to multiple languages.
 
     Args:
+        client: AsyncZaban client
         texts: List of texts to translate
         target_langs: List of target language codes
-        batch_size: Number of concurrent translations
+        batch_size: Number of texts per batch request
+        concurrency: Maximum number of batch requests in flight
 
     Returns:
         List of tuples (original_text, target_lang, translated_text)
     """
-    async with AsyncZaban(api_key=API_KEY) as client:
-        results = []
-        total = len(texts) * len(target_langs)
-        processed = 0
-
-        print(f"Translating {len(texts)} texts to {len(target_langs)} languages...")
-        print(f"Total translations: {total}\n")
-
-        start_time = time.time()
+    # Translate each distinct text only once; duplicates are filled in at the end
+    unique_texts = list(dict.fromkeys(texts))
+    total = len(texts) * len(target_langs)
+    unique_total = len(unique_texts) * len(target_langs)
+    processed = 0
+
+    print(f"Translating {len(texts)} texts to {len(target_langs)} languages...")
+    print(f"Total translations: {total} ({unique_total} sent, {total - unique_total} duplicates)\n")
+
+    start_time = time.time()
+
+    # Keep `concurrency` requests in flight, starting the next one as soon as any finishes
+    semaphore = asyncio.Semaphore(concurrency)
+
+    # Detect each distinct text's language once, rather than having the server
+    # auto-detect it again for every target language
+    detect_supported = True
+
+    async def detect(text: str) -> Optional[str]:
+        nonlocal detect_supported
+        if not detect_supported:
+            return None
+        async with semaphore:
+            try:
+                return (await client.translation.detect(text)).source_lang
+            except (APIError, ValidationError) as e:
+                # Servers without the detect endpoint reject it with a 4xx;
+                # let the server auto-detect every text instead
+                if e.status_code is None or not 400 <= e.status_code < 500:
+                    raise
+                detect_supported = False
+                return None
+
+    # Detect the first text on its own, so a server without the endpoint costs
+    # one failed request rather than one per text
+    detected = [await detect(text) for text in unique_texts[:1]]
+    detected += await gather_or_cancel(*[detect(text) for text in unique_texts[1:]])
+
+    # Validate one request per text up front; per-language requests are cheap
+    # copies of it with only target_lang changed
+    templates = [
+        TranslationRequest(
+            text=text,
+            source_lang=source_lang,
+            target_lang=target_langs[0],
+            auto_detect=source_lang is None,
+        )
+        for text, source_lang in zip(unique_texts, detected)
+    ]
+
+    # One batch per (chunk of texts, target language): languages with slower
+    # models only hold up their own batches, while results for the other
+    # languages keep arriving. Each request is tagged with its output slot.
+    batches: List[List[Tuple[int, TranslationRequest]]] = []
+    for start in range(0, len(unique_texts), batch_size):
+        chunk = range(start, min(start + batch_size, len(unique_texts)))
+        for lang_index, target_lang in enumerate(target_langs):
+            batches.append(
+                [
+                    (
+                        i * len(target_langs) + lang_index,
+                        templates[i].model_copy(update={"target_lang": target_lang}),
+                    )
+                    for i in chunk
+                ]
+            )
 
-        # Process in batches
-        for i in range(0, len(texts), batch_size):
-            batch_texts = texts[i : i + batch_size]
+    unique_results: List[Tuple[str, str, str]] = [("", "", "")] * unique_total
 
-            # Create tasks for all language combinations in batch
-            tasks = []
-            task_metadata = []
+    async def translate_batch(batch: List[Tuple[int, TranslationRequest]]):
+        nonlocal processed
+        async with semaphore:
+            translations = await translate_items(client, [request for _, request in batch])
 
-            for text in batch_texts:
-                for target_lang in target_langs:
-                    tasks.append(
-                        client.translation.create(
-                            text=text, target_lang=target_lang, auto_detect=True
-                        )
-                    )
-                    task_metadata.append((text, target_lang))
+        # Slot results in as each batch completes, keeping the original order
+        for (slot, request), result in zip(batch, translations):
+            unique_results[slot] = (request.text, request.target_lang, result.translated_text)
+        processed += len(batch)
 
-            # Execute batch
-            batch_results = await asyncio.gather(*tasks)
+        # Overwrite one progress line instead of printing a line per batch
+        print(f"Sent {processed}/{unique_total} translations", end="\r")
 
-            # Collect results
-            for (text, target_lang), result in zip(task_metadata, batch_results):
-                results.append((text, target_lang, result.translated_text))
-                processed += 1
+    # If one batch fails, cancel the rest rather than waiting on discarded results
+    await gather_or_cancel(*[translate_batch(batch) for batch in batches])
 
-            print(f"Processed {processed}/{total} translations")
+    # Map the distinct results back onto the original (possibly repeated) texts
+    unique_index = {text: i for i, text in enumerate(unique_texts)}
+    results = [
+        unique_results[unique_index[text] * len(target_langs) + lang_index]
+        for text in texts
+        for lang_index in range(len(target_langs))
+    ]
 
-        elapsed_time = time.time() - start_time
-        print(f"\nCompleted in {elapsed_time:.2f} seconds")
-        print(f"Average: {elapsed_time/total:.2f} seconds per translation\n")
+    elapsed_time = time.time() - start_time
+    print(f"\n\nCompleted in {elapsed_time:.2f} seconds")
+    print(f"Average: {elapsed_time/unique_total:.2f} seconds per translation sent\n")
 
-        return results
+    return results
 
 
-async def compare_translations():
+async def compare_translations(client: AsyncZaban):
     """Compare translations across multiple target languages."""
     print("=== Translation Comparison ===\n")
 
-    async with AsyncZaban(api_key=API_KEY) as client:
-        text = "Artificial intelligence is transforming the world"
+    text = "Artificial intelligence is transforming the world"
 
-        target_langs = [
-            ("hin_Deva", "Hindi"),
-            ("tam_Taml", "Tamil"),
-            ("ben_Beng", "Bengali"),
-            ("tel_Telu", "Telugu"),
-            ("mar_Deva", "Marathi"),
-        ]
+    target_langs = [
+        ("hin_Deva", "Hindi"),
+        ("tam_Taml", "Tamil"),
+        ("ben_Beng", "Bengali"),
+        ("tel_Telu", "Telugu"),
+        ("mar_Deva", "Marathi"),
+    ]
 
-        print(f"Original: {text}\n")
+    print(f"Original: {text}\n")
 
-        # Translate to all languages concurrently
-        tasks = [
-            client.translation.create(text=text, target_lang=lang_code, auto_detect=True)
-            for lang_code, _ in target_langs
-        ]
+    # Translate to all languages concurrently; only target_lang varies per call
+    translate_to = functools.partial(client.translation.create, text=text, auto_detect=True)
+    tasks = [translate_to(target_lang=lang_code) for lang_code, _ in target_langs]
 
-        results = await asyncio.gather(*tasks)
+    results = await gather_or_cancel(*tasks)
 
-        # Display results
-        for (_, lang_name), result in zip(target_langs, results):
-            print(f"{lang_name:12} | {result.translated_text}")
+    # Display results with a single write
+    lines = [
+        f"{lang_name:12} | {result.translated_text}"
+        for (_, lang_name), result in zip(target_langs, results)
+    ]
+    print("\n".join(lines))
 
-        print()
+    print()
+
+
+async def progressive_translation(client: AsyncZaban, seeds: List[str]):
+    """Translate texts progressively through multiple languages.
 
+    Each text's chain is sequential, but the chains for different texts run
+    concurrently, so K texts take about as long as one.
 
-async def progressive_translation():
-    """Translate text progressively through multiple languages."""
+    Args:
+        client: AsyncZaban client
+        seeds: English texts to start each chain from
+    """
     print("=== Progressive Translation ===\n")
 
-    async with AsyncZaban(api_key=API_KEY) as client:
+    # Translation chain
+    chain = [
+        ("hin_Deva", "Hindi"),
+        ("ben_Beng", "Bengali"),
+        ("tam_Taml", "Tamil"),
+        ("eng_Latn", "English (back)"),
+    ]
+
+    async def chain_one(text: str) -> List[Tuple[str, str]]:
         # Start with English
-        current_text = "Knowledge is power"
+        current_text = text
         current_lang = "eng_Latn"
-
-        # Translation chain
-        chain = [
-            ("hin_Deva", "Hindi"),
-            ("ben_Beng", "Bengali"),
-            ("tam_Taml", "Tamil"),
-            ("eng_Latn", "English (back)"),
-        ]
-
-        print(f"Original: {current_text} ({current_lang})\n")
+        steps = []
 
         for target_lang, lang_name in chain:
             result = await client.translation.create(
                 text=current_text, source_lang=current_lang, target_lang=target_lang
             )
-
-            print(f"-> {lang_name:20} | {result.translated_text}")
+            steps.append((lang_name, result.translated_text))
 
             current_text = result.translated_text
             current_lang = target_lang
 
+        return steps
+
+    all_steps = await gather_or_cancel(*[chain_one(seed) for seed in seeds])
+
+    for seed, steps in zip(seeds, all_steps):
+        print(f"Original: {seed} (eng_Latn)\n")
+        lines = [f"-> {lang_name:20} | {translated_text}" for lang_name, translated_text in steps]
+        print("\n".join(lines))
         print()
 
 
@@ -193,39 +449,45 @@ async def main():
     print("=" * 50 + "\n")
 
     try:
-        # Example 1: Compare translations
-        await compare_translations()
-
-        # Example 2: Progressive translation
-        await progressive_translation()
-
-        # Example 3: Translate dataset
-        sample_texts = [
-            "Hello, world!",
-            "Good morning",
-            "Thank you",
-            "How are you?",
-            "Nice to meet you",
-        ]
-
-        sample_langs = ["hin_Deva", "tam_Taml"]
-
-        results = await translate_dataset(sample_texts, sample_langs, batch_size=5)
-
-        print("=== Dataset Translation Results ===\n")
-        for text, lang, translation in results[:5]:  # Show first 5
-            print(f"{text:25} ({lang}) -> {translation}")
-        print(f"... and {len(results) - 5} more\n")
-
-        # Example 4: File translation (uncomment if you have a file)
-        # async with AsyncZaban() as client:
-        #     await translate_file(
-        #         client,
-        #         "input.txt",
-        #         "output_hindi.txt",
-        #         "hin_Deva",
-        #         batch_size=10
-        #     )
+        # One client for the whole application, so all examples share its
+        # connection pool instead of reconnecting for each call. Repeated
+        # translations (e.g. common phrases) are served from the cache.
+        async with AsyncZaban(api_key=API_KEY, cache_size=1024) as client:
+            # Example 1: Compare translations
+            await compare_translations(client)
+
+            # Example 2: Progressive translation
+            await progressive_translation(client, ["Knowledge is power", "Time is money"])
+
+            # Example 3: Translate dataset
+            sample_texts = [
+                "Hello, world!",
+                "Good morning",
+                "Thank you",
+                "How are you?",
+                "Nice to meet you",
+            ]
+
+            sample_langs = ["hin_Deva", "tam_Taml"]
+
+            results = await translate_dataset(client, sample_texts, sample_langs, batch_size=5)
+
+            print("=== Dataset Translation Results ===\n")
+            # Show first 5
+            lines = [
+                f"{text:25} ({lang}) -> {translation}" for text, lang, translation in results[:5]
+            ]
+            print("\n".join(lines))
+            print(f"... and {len(results) - 5} more\n")
+
+            # Example 4: File translation (uncomment if you have a file)
+            # await translate_file(
+            #     client,
+            #     "input.txt",
+            #     "output_hindi.txt",
+            #     "hin_Deva",
+            #     batch_size=10
+            # )
 
     except Exception as e:
         print(f"Error: {e}")
@@ -234,4 +496,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main)
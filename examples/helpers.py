@@ -0,0 +1,42 @@
+"""Shared helpers for the async examples."""
+
+import asyncio
+from typing import Awaitable, Callable, List, TypeVar
+
+T = TypeVar("T")
+
+
+async def gather_or_cancel(*aws: Awaitable[T]) -> List[T]:
+    """Run awaitables concurrently, cancelling the rest as soon as one fails.
+
+    Unlike plain asyncio.gather, a failure doesn't leave sibling requests
+    running (and using API quota) for results that will be discarded. Works
+    like asyncio.TaskGroup but keeps the original exception type and runs on
+    Python 3.8+.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+def run(main: Callable[[], Awaitable[T]]) -> T:
+    """Run an example's main() coroutine function, on uvloop when it is installed."""
+
+    async def run_main() -> T:
+        # Python 3.12+: run new tasks eagerly until their first await, which skips
+        # an event loop round-trip for each of the many fan-out tasks
+        if hasattr(asyncio, "eager_task_factory"):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+        return await main()
+
+    # Use uvloop's faster event loop when installed (`pip install uvloop`,
+    # not available on Windows); otherwise fall back to the default loop
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(run_main())
+    return uvloop.run(run_main())
@@ -0,0 +1,125 @@
+"""Tests for in-memory response caches."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from zaban._cache import AsyncTTLCache, TTLCache
+
+
+def test_cache_get_set():
+    """Test storing and retrieving values."""
+    cache = TTLCache(max_size=2)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("missing") is None
+
+
+def test_cache_evicts_least_recently_used():
+    """Test the least recently used entry is evicted when full."""
+    cache = TTLCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+
+def test_cache_ttl_expiry():
+    """Test entries expire after the TTL."""
+    cache = TTLCache(ttl=10.0)
+
+    with patch("zaban._cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+    with patch("zaban._cache.time.monotonic", return_value=105.0):
+        assert cache.get("a") == 1
+    with patch("zaban._cache.time.monotonic", return_value=111.0):
+        assert cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_async_cache_shares_in_flight_calls():
+    """Test concurrent callers for the same key share one call."""
+    cache = AsyncTTLCache()
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return "value"
+
+    results = await asyncio.gather(*[cache.get_or_create("key", factory) for _ in range(5)])
+
+    assert results == ["value"] * 5
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_async_cache_does_not_keep_failures():
+    """Test failed calls are removed so the next call retries."""
+    cache = AsyncTTLCache()
+
+    async def failing():
+        raise RuntimeError("boom")
+
+    async def succeeding():
+        return "value"
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_create("key", failing)
+
+    assert await cache.get_or_create("key", succeeding) == "value"
+
+
+@pytest.mark.asyncio
+async def test_async_cache_cancels_call_without_waiters():
+    """Test cancelling the only caller cancels the call and drops the entry."""
+    cache = AsyncTTLCache()
+    started = asyncio.Event()
+    cancelled = False
+
+    async def factory():
+        nonlocal cancelled
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    caller = asyncio.ensure_future(cache.get_or_create("key", factory))
+    await started.wait()
+    caller.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+    await asyncio.sleep(0)
+
+    assert cancelled
+    assert cache.get("key") is None
+
+
+@pytest.mark.asyncio
+async def test_async_cache_keeps_call_for_remaining_waiters():
+    """Test cancelling one of several callers leaves the shared call running."""
+    cache = AsyncTTLCache()
+    release = asyncio.Event()
+
+    async def factory():
+        await release.wait()
+        return "value"
+
+    first = asyncio.ensure_future(cache.get_or_create("key", factory))
+    second = asyncio.ensure_future(cache.get_or_create("key", factory))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == "value"
+    assert first.cancelled()
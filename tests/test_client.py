@@ -1,5 +1,9 @@
 """Tests for Zaban client initialization and configuration."""
 
+import gzip
+import json
+
+import httpx
 import pytest
 
 from zaban import AsyncZaban, Zaban
@@ -80,3 +84,94 @@ def test_async_client_has_resources():
     assert hasattr(client, "translation")
     assert hasattr(client, "audio")
     assert hasattr(client, "transliteration")
+
+
+def test_client_shared_http_client_not_closed():
+    """Test a caller-provided http client is reused and left open."""
+    http_client = httpx.Client()
+    with Zaban(api_key="sk-test-key", http_client=http_client) as client:
+        assert client._client._client is http_client
+    assert not http_client.is_closed
+    http_client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_shared_http_client_not_closed():
+    """Test async clients can share one http client across instances."""
+    async with httpx.AsyncClient() as http_client:
+        async with AsyncZaban(api_key="sk-test-key", http_client=http_client) as first:
+            assert first._client._client is http_client
+        async with AsyncZaban(api_key="sk-other-key", http_client=http_client) as second:
+            assert second._client._client is http_client
+        assert not http_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_async_client_closes_own_http_client():
+    """Test async client closes the http client it created."""
+    client = AsyncZaban(api_key="sk-test-key")
+    await client.aclose()
+    assert client._client._client.is_closed
+
+
+def test_client_request_encodes_json_body():
+    """Test requests send a JSON body with auth headers and decode the response."""
+    seen = {}
+
+    def handler(request):
+        seen["headers"] = request.headers
+        seen["body"] = json.loads(request.content)
+        return httpx.Response(200, json={"translated_text": "नमस्ते"})
+
+    http_client = httpx.Client(transport=httpx.MockTransport(handler))
+    client = Zaban(api_key="sk-test-key", http_client=http_client)
+
+    data = client._client.request("POST", "/translate", json={"text": "Hello"})
+
+    assert data == {"translated_text": "नमस्ते"}
+    assert seen["body"] == {"text": "Hello"}
+    assert seen["headers"]["X-API-Key"] == "sk-test-key"
+    assert seen["headers"]["Content-Type"] == "application/json"
+
+
+def test_connection_options(monkeypatch):
+    """Test HTTP/2 is only enabled when h2 is installed."""
+    from zaban import _client
+
+    monkeypatch.setattr(_client, "HTTP2_AVAILABLE", True)
+    assert _client._connection_options()["http2"] is True
+
+    monkeypatch.setattr(_client, "HTTP2_AVAILABLE", False)
+    options = _client._connection_options()
+    assert "http2" not in options
+    assert options["limits"].max_keepalive_connections == 100
+
+
+@pytest.mark.parametrize("compress_requests", [True, False])
+def test_client_request_compression(compress_requests):
+    """Test large JSON bodies are gzipped only when compression is enabled."""
+    seen = {}
+
+    def handler(request):
+        seen["headers"] = request.headers
+        seen["content"] = request.content
+        return httpx.Response(200, json={})
+
+    http_client = httpx.Client(transport=httpx.MockTransport(handler))
+    client = Zaban(
+        api_key="sk-test-key", http_client=http_client, compress_requests=compress_requests
+    )
+    body = {"items": [{"text": "Hello, how are you?", "target_lang": "hin_Deva"}] * 100}
+
+    client._client.request("POST", "/translate/batch", json=body)
+
+    if compress_requests:
+        assert seen["headers"]["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(seen["content"])) == body
+    else:
+        assert "Content-Encoding" not in seen["headers"]
+        assert json.loads(seen["content"]) == body
+
+    # Small bodies are never compressed
+    client._client.request("POST", "/translate", json={"text": "Hello"})
+    assert "Content-Encoding" not in seen["headers"]
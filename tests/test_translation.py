@@ -139,3 +139,270 @@ async def test_async_translation_batch():
         assert len(results) == 2
         assert results[0].translated_text == "नमस्ते"
         assert results[1].translated_text == "धन्यवाद"
+
+
+def test_translation_create_batch():
+    """Test translation.create_batch() sends one request for all items."""
+    client = Zaban(api_key="sk-test-key")
+
+    mock_response = {
+        "results": [
+            {
+                "translated_text": "नमस्ते",
+                "source_lang": "eng_Latn",
+                "target_lang": "hin_Deva",
+                "model": "test",
+            },
+            {
+                "translated_text": "வணக்கம்",
+                "source_lang": "eng_Latn",
+                "target_lang": "tam_Taml",
+                "model": "test",
+            },
+        ]
+    }
+
+    with patch.object(client._client, "request", return_value=mock_response) as mock_request:
+        results = client.translation.create_batch(
+            [("Hello", "hin_Deva"), ("Hello", "tam_Taml")], source_lang="eng_Latn"
+        )
+
+        assert mock_request.call_count == 1
+        assert mock_request.call_args.kwargs["path"] == "/translate/batch"
+        items = mock_request.call_args.kwargs["json"]["items"]
+        assert [item["target_lang"] for item in items] == ["hin_Deva", "tam_Taml"]
+        assert all(item["source_lang"] == "eng_Latn" for item in items)
+        assert [r.translated_text for r in results] == ["नमस्ते", "வணக்கம்"]
+
+
+def test_translation_create_batch_empty():
+    """Test translation.create_batch() with no items skips the request."""
+    client = Zaban(api_key="sk-test-key")
+
+    with patch.object(client._client, "request") as mock_request:
+        assert client.translation.create_batch([]) == []
+        mock_request.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_translation_create_batch(mock_translation_response):
+    """Test async translation.create_batch() method."""
+    client = AsyncZaban(api_key="sk-test-key")
+
+    async def mock_request(*args, **kwargs):
+        return {"results": [mock_translation_response] * len(kwargs["json"]["items"])}
+
+    with patch.object(client._client, "request", side_effect=mock_request):
+        results = await client.translation.create_batch(
+            [("How are you?", "hin_Deva"), ("Are you well?", "hin_Deva")], auto_detect=True
+        )
+
+        assert len(results) == 2
+        assert all(isinstance(r, TranslationResponse) for r in results)
+
+
+def test_translation_cache(mock_translation_response):
+    """Test repeated translations are served from the cache."""
+    client = Zaban(api_key="sk-test-key", cache_size=10)
+
+    with patch.object(
+        client._client, "request", return_value=mock_translation_response
+    ) as mock_request:
+        first = client.translation.create(text="How are you?", target_lang="hin_Deva")
+        second = client.translation.create(text="How are you?", target_lang="hin_Deva")
+        client.translation.create(text="How are you?", target_lang="tam_Taml")
+
+        assert first is second
+        assert mock_request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_translation_cache_deduplicates(mock_translation_response):
+    """Test concurrent identical async translations issue one request."""
+    import asyncio
+
+    client = AsyncZaban(api_key="sk-test-key", cache_size=10)
+
+    async def mock_request(*args, **kwargs):
+        await asyncio.sleep(0)
+        return mock_translation_response
+
+    with patch.object(client._client, "request", side_effect=mock_request) as request:
+        results = await asyncio.gather(
+            *[
+                client.translation.create(text="How are you?", target_lang="hin_Deva")
+                for _ in range(3)
+            ]
+        )
+
+        assert request.call_count == 1
+        assert all(r.translated_text == "आप कैसे हैं?" for r in results)
+
+
+def test_translation_detect():
+    """Test translation.detect() method."""
+    client = Zaban(api_key="sk-test-key")
+
+    mock_response = {"source_lang": "eng_Latn", "confidence": 0.98}
+
+    with patch.object(client._client, "request", return_value=mock_response) as mock_request:
+        result = client.translation.detect("Hello")
+
+        assert mock_request.call_args.kwargs["path"] == "/detect"
+        assert mock_request.call_args.kwargs["json"] == {"text": "Hello"}
+        assert result.source_lang == "eng_Latn"
+        assert str(result) == "eng_Latn"
+
+
+@pytest.mark.asyncio
+async def test_async_translation_detect_cached():
+    """Test async detection results are cached per text."""
+    client = AsyncZaban(api_key="sk-test-key", cache_size=10)
+
+    async def mock_request(*args, **kwargs):
+        return {"source_lang": "eng_Latn"}
+
+    with patch.object(client._client, "request", side_effect=mock_request) as request:
+        first = await client.translation.detect("Hello")
+        second = await client.translation.detect("Hello")
+
+        assert first.source_lang == second.source_lang == "eng_Latn"
+        assert request.call_count == 1
+
+
+def test_translation_create_batch_deduplicates(mock_translation_response):
+    """Test identical batch items are sent once and cached results are reused."""
+    client = Zaban(api_key="sk-test-key", cache_size=10)
+
+    def mock_request(*args, **kwargs):
+        if kwargs["path"] == "/translate":
+            return mock_translation_response
+        return {"results": [mock_translation_response] * len(kwargs["json"]["items"])}
+
+    with patch.object(client._client, "request", side_effect=mock_request) as request:
+        client.translation.create(text="Hello", target_lang="hin_Deva")
+        results = client.translation.create_batch(
+            [("Hello", "hin_Deva"), ("Bye", "hin_Deva"), ("Bye", "hin_Deva")]
+        )
+
+        assert len(results) == 3
+        assert results[1] is results[2]
+        assert request.call_args.kwargs["json"]["items"] == [
+            {"text": "Bye", "target_lang": "hin_Deva", "auto_detect": False}
+        ]
+
+
+@pytest.mark.asyncio
+async def test_async_translation_create_batch_shares_in_flight(mock_translation_response):
+    """Test concurrent async create() calls wait on a matching in-flight batch."""
+    import asyncio
+
+    client = AsyncZaban(api_key="sk-test-key", cache_size=10)
+
+    async def mock_request(*args, **kwargs):
+        await asyncio.sleep(0)
+        return {"results": [mock_translation_response] * len(kwargs["json"]["items"])}
+
+    with patch.object(client._client, "request", side_effect=mock_request) as request:
+        batch, single = await asyncio.gather(
+            client.translation.create_batch([("Hello", "hin_Deva"), ("Hello", "hin_Deva")]),
+            client.translation.create(text="Hello", target_lang="hin_Deva"),
+        )
+
+        assert request.call_count == 1
+        assert batch[0] is batch[1] is single
+
+
+@pytest.mark.asyncio
+async def test_async_translation_create_batch_cancelled_caller(mock_translation_response):
+    """Test cancelling a batch caller doesn't cancel callers sharing its request."""
+    import asyncio
+
+    client = AsyncZaban(api_key="sk-test-key", cache_size=10)
+    sent = asyncio.Event()
+    release = asyncio.Event()
+
+    async def mock_request(*args, **kwargs):
+        sent.set()
+        await release.wait()
+        return {"results": [mock_translation_response] * len(kwargs["json"]["items"])}
+
+    with patch.object(client._client, "request", side_effect=mock_request) as request:
+        batch = asyncio.ensure_future(client.translation.create_batch([("Hello", "hin_Deva")]))
+        await sent.wait()
+        single = asyncio.ensure_future(
+            client.translation.create(text="Hello", target_lang="hin_Deva")
+        )
+        await asyncio.sleep(0)
+
+        batch.cancel()
+        release.set()
+
+        result = await single
+        assert batch.cancelled()
+        assert request.call_count == 1
+        assert result.translated_text == mock_translation_response["translated_text"]
+
+
+@pytest.mark.asyncio
+async def test_async_translation_cached_create_cancellable(mock_translation_response):
+    """Test cancelling the only caller of a cached create() cancels its request."""
+    import asyncio
+
+    client = AsyncZaban(api_key="sk-test-key", cache_size=10)
+    sent = asyncio.Event()
+    cancelled = False
+
+    async def mock_request(*args, **kwargs):
+        nonlocal cancelled
+        sent.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        return mock_translation_response
+
+    with patch.object(client._client, "request", side_effect=mock_request):
+        caller = asyncio.ensure_future(
+            client.translation.create(text="Hello", target_lang="hin_Deva")
+        )
+        await sent.wait()
+        caller.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0)
+
+        assert cancelled
+
+
+@pytest.mark.asyncio
+async def test_async_translation_cached_create_batch_cancellable(mock_translation_response):
+    """Test cancelling the only caller of a cached create_batch() cancels its request."""
+    import asyncio
+
+    client = AsyncZaban(api_key="sk-test-key", cache_size=10)
+    sent = asyncio.Event()
+    cancelled = False
+
+    async def mock_request(*args, **kwargs):
+        nonlocal cancelled
+        sent.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        return {"results": [mock_translation_response]}
+
+    with patch.object(client._client, "request", side_effect=mock_request):
+        caller = asyncio.ensure_future(client.translation.create_batch([("Hello", "hin_Deva")]))
+        await sent.wait()
+        caller.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0)
+
+        assert cancelled
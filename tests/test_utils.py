@@ -2,8 +2,11 @@
 
 import pytest
 
+from zaban import _utils
 from zaban._utils import (
     SUPPORTED_LANGUAGES,
+    decode_json,
+    encode_json,
     get_api_key_from_env,
     validate_api_key,
     validate_language_code,
@@ -76,3 +79,19 @@ def test_supported_languages():
     assert SUPPORTED_LANGUAGES["eng_Latn"] == "English (Latin)"
     assert SUPPORTED_LANGUAGES["hin_Deva"] == "Hindi (Devanagari)"
     assert SUPPORTED_LANGUAGES["tam_Taml"] == "Tamil (Tamil)"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_round_trip(monkeypatch, use_orjson):
+    """Test JSON encoding and decoding with and without orjson."""
+    if not use_orjson:
+        monkeypatch.setattr(_utils, "ORJSON_AVAILABLE", False)
+    elif not _utils.ORJSON_AVAILABLE:
+        pytest.skip("orjson is not installed")
+
+    data = {"text": "नमस्ते", "auto_detect": True, "items": [1, None]}
+    encoded = encode_json(data)
+
+    assert isinstance(encoded, bytes)
+    assert "नमस्ते".encode() in encoded
+    assert decode_json(encoded) == data
@@ -34,7 +34,11 @@ from ._exceptions import (
 from .client import AsyncZaban, Zaban
 from .types import (
     AudioFormat,
+    BatchTranslationRequest,
+    BatchTranslationResponse,
     LanguageCode,
+    LanguageDetectionRequest,
+    LanguageDetectionResponse,
     Script,
     Speaker,
     STTRequest,
@@ -67,6 +71,10 @@ __all__ = [
     "LanguageCode",
     "TranslationRequest",
     "TranslationResponse",
+    "BatchTranslationRequest",
+    "BatchTranslationResponse",
+    "LanguageDetectionRequest",
+    "LanguageDetectionResponse",
     "TTSRequest",
     "TTSResponse",
     "AudioFormat",
@@ -0,0 +1,137 @@
+"""In-memory caches for API responses."""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def text_key(text: str) -> bytes:
+    """Return a compact, fixed-size digest of text for use in cache keys."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class TTLCache:
+    """Least-recently-used cache with optional expiry."""
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = None):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries kept
+            ttl: Seconds an entry stays valid. None keeps entries until evicted.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class AsyncTTLCache(TTLCache):
+    """Async cache that also shares in-flight calls for the same key.
+
+    Entries are tasks, so concurrent callers asking for the same key await
+    one request instead of each issuing their own. Failed calls are not cached,
+    and a call is cancelled once every caller waiting on it has been cancelled.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = None):
+        super().__init__(max_size=max_size, ttl=ttl)
+        self._waiters: Dict[asyncio.Future[Any], int] = {}
+
+    async def get_or_create(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached result for key, calling factory on a miss.
+
+        Args:
+            key: Cache key
+            factory: Called with no arguments to produce the value on a miss
+
+        Returns:
+            The cached or newly produced value
+        """
+        task = self.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._store(key, task)
+
+        return await self.wait(task)
+
+    async def wait(self, future: "asyncio.Future[T]") -> T:
+        """Wait for a cached future, cancelling it if no other caller still needs it.
+
+        Args:
+            future: Future or task stored in this cache
+
+        Returns:
+            The future's result
+        """
+        self._waiters[future] = self._waiters.get(future, 0) + 1
+        try:
+            # Shield so one caller being cancelled doesn't cancel the shared request
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if self._waiters[future] == 1:
+                future.cancel()
+            raise
+        finally:
+            self._waiters[future] -= 1
+            if not self._waiters[future]:
+                del self._waiters[future]
+
+    def waiting(self, future: "asyncio.Future[Any]") -> int:
+        """Return how many callers are waiting on future through wait()."""
+        return self._waiters.get(future, 0)
+
+    def reserve(self, key: Hashable) -> "asyncio.Future[Any]":
+        """Store and return a pending future for key, for the caller to resolve.
+
+        Other callers of get_or_create() for key wait on this future until the
+        caller sets its result. Failed or cancelled futures are dropped.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._store(key, future)
+        return future
+
+    def _store(self, key: Hashable, future: "asyncio.Future[Any]") -> None:
+        """Cache future under key, dropping it again if it fails."""
+        future.add_done_callback(lambda f: self._discard_failed(key, f))
+        self.set(key, future)
+
+    def _discard_failed(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        """Drop a finished task from the cache if it did not succeed."""
+        if task.cancelled() or task.exception() is not None:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is task:
+                del self._entries[key]
@@ -1,5 +1,7 @@
 """Base HTTP client for Zaban API."""
 
+import gzip
+import importlib.util
 from typing import Any, Dict, Optional, cast
 
 import httpx
@@ -12,6 +14,28 @@ from ._exceptions import (
     TimeoutError,
     ValidationError,
 )
+from ._utils import decode_json, encode_json
+
+# Request bodies smaller than this aren't worth compressing
+GZIP_MIN_SIZE = 1024
+
+# HTTP/2 needs the optional h2 package (installed with the "speedups" extra)
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _connection_options() -> Dict[str, Any]:
+    """Connection options for the httpx clients created by Zaban clients.
+
+    With HTTP/2, concurrent requests are multiplexed over a few connections,
+    so only a small keep-alive pool is needed. Without it, keep enough
+    HTTP/1.1 connections alive to serve concurrent requests without reconnecting.
+    """
+    if HTTP2_AVAILABLE:
+        return {
+            "http2": True,
+            "limits": httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        }
+    return {"limits": httpx.Limits(max_connections=100, max_keepalive_connections=100)}
 
 
 class BaseClient:
@@ -24,6 +48,8 @@ class BaseClient:
         base_url: str = "http://localhost:8000/api/v1",
         timeout: float = 30.0,
         max_retries: int = 2,
+        http_client: Optional[httpx.Client] = None,
+        compress_requests: bool = False,
     ):
         """Initialize the base client.
 
@@ -32,17 +58,24 @@ class BaseClient:
             base_url: Base URL for the API
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
+            http_client: Existing httpx client to reuse. It is not closed by this client.
+            compress_requests: Gzip JSON request bodies larger than 1 KB
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
+        self.compress_requests = compress_requests
+
+        # Auth headers are sent per request so a shared httpx client works for any
+        # key. The key is static (there is no token exchange), so build them once.
+        self._headers = self._get_headers()
+        self._upload_headers = {"X-API-Key": self.api_key}
+        self._gzip_headers = {**self._headers, "Content-Encoding": "gzip"}
 
-        # Create httpx client
-        self._client = httpx.Client(
-            timeout=timeout,
-            headers=self._get_headers(),
-        )
+        # Reuse the caller's httpx client if given, otherwise create our own
+        self._owns_client = http_client is None
+        self._client = http_client or httpx.Client(timeout=timeout, **_connection_options())
 
     def _get_headers(self) -> Dict[str, str]:
         """Get default headers for requests."""
@@ -109,14 +142,18 @@ class BaseClient:
 
         try:
             # For file uploads, don't set Content-Type (httpx will set it)
-            headers = None
-            if files:
-                headers = {"X-API-Key": self.api_key}
+            headers = self._upload_headers if files else self._headers
+
+            # Encode the body ourselves so orjson is used when available
+            content = encode_json(json) if json is not None else None
+            if self.compress_requests and content is not None and len(content) > GZIP_MIN_SIZE:
+                content = gzip.compress(content, compresslevel=6)
+                headers = self._gzip_headers
 
             response = self._client.request(
                 method=method,
                 url=url,
-                json=json,
+                content=content,
                 files=files,
                 params=params,
                 headers=headers,
@@ -127,7 +164,7 @@ class BaseClient:
                 self._handle_error_response(response)
 
             # Return JSON response
-            return cast(Dict[str, Any], response.json())
+            return cast(Dict[str, Any], decode_json(response.content))
 
         except httpx.TimeoutException as e:
             raise TimeoutError(f"Request timed out after {self.timeout}s") from e
@@ -137,8 +174,9 @@ class BaseClient:
             raise APIError(f"HTTP error occurred: {str(e)}") from e
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
+        """Close the HTTP client if it was created by this client."""
+        if self._owns_client:
+            self._client.close()
 
     def __enter__(self):
         """Context manager entry."""
@@ -159,6 +197,8 @@ class AsyncBaseClient:
         base_url: str = "http://localhost:8000/api/v1",
         timeout: float = 30.0,
         max_retries: int = 2,
+        http_client: Optional[httpx.AsyncClient] = None,
+        compress_requests: bool = False,
     ):
         """Initialize the async base client.
 
@@ -167,17 +207,24 @@ class AsyncBaseClient:
             base_url: Base URL for the API
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
+            http_client: Existing httpx client to reuse. It is not closed by this client.
+            compress_requests: Gzip JSON request bodies larger than 1 KB
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
+        self.compress_requests = compress_requests
 
-        # Create async httpx client
-        self._client = httpx.AsyncClient(
-            timeout=timeout,
-            headers=self._get_headers(),
-        )
+        # Auth headers are sent per request so a shared httpx client works for any
+        # key. The key is static (there is no token exchange), so build them once.
+        self._headers = self._get_headers()
+        self._upload_headers = {"X-API-Key": self.api_key}
+        self._gzip_headers = {**self._headers, "Content-Encoding": "gzip"}
+
+        # Reuse the caller's httpx client if given, otherwise create our own
+        self._owns_client = http_client is None
+        self._client = http_client or httpx.AsyncClient(timeout=timeout, **_connection_options())
 
     def _get_headers(self) -> Dict[str, str]:
         """Get default headers for requests."""
@@ -244,14 +291,18 @@ class AsyncBaseClient:
 
         try:
             # For file uploads, don't set Content-Type (httpx will set it)
-            headers = None
-            if files:
-                headers = {"X-API-Key": self.api_key}
+            headers = self._upload_headers if files else self._headers
+
+            # Encode the body ourselves so orjson is used when available
+            content = encode_json(json) if json is not None else None
+            if self.compress_requests and content is not None and len(content) > GZIP_MIN_SIZE:
+                content = gzip.compress(content, compresslevel=6)
+                headers = self._gzip_headers
 
             response = await self._client.request(
                 method=method,
                 url=url,
-                json=json,
+                content=content,
                 files=files,
                 params=params,
                 headers=headers,
@@ -262,7 +313,7 @@ class AsyncBaseClient:
                 self._handle_error_response(response)
 
             # Return JSON response
-            return cast(Dict[str, Any], response.json())
+            return cast(Dict[str, Any], decode_json(response.content))
 
         except httpx.TimeoutException as e:
             raise TimeoutError(f"Request timed out after {self.timeout}s") from e
@@ -272,8 +323,9 @@ class AsyncBaseClient:
             raise APIError(f"HTTP error occurred: {str(e)}") from e
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client if it was created by this client."""
+        if self._owns_client:
+            await self._client.aclose()
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -1,7 +1,15 @@
 """Utility functions for the Zaban client."""
 
+import json
 import os
-from typing import Optional
+from typing import Any, Optional
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # optional speedup, see the "speedups" extra
+    ORJSON_AVAILABLE = False
 
 
 def get_api_key_from_env() -> Optional[str]:
@@ -38,6 +46,34 @@ def validate_api_key(api_key: Optional[str]) -> str:
     return api_key
 
 
+def encode_json(data: Any) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Encoded JSON body
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def decode_json(content: bytes) -> Any:
+    """Parse a JSON response body, using orjson when it is installed.
+
+    Args:
+        content: Raw response body
+
+    Returns:
+        Decoded JSON data
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
 # Supported language codes (BCP-47 format with script)
 SUPPORTED_LANGUAGES = {
     "eng_Latn": "English (Latin)",
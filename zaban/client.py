@@ -2,6 +2,9 @@
 
 from typing import Optional
 
+import httpx
+
+from ._cache import AsyncTTLCache, TTLCache
 from ._client import AsyncBaseClient, BaseClient
 from ._utils import get_api_key_from_env, validate_api_key
 from .resources import (
@@ -78,6 +81,10 @@ class Zaban:
         base_url: str = "http://localhost:8000/api/v1",
         timeout: float = 30.0,
         max_retries: int = 2,
+        http_client: Optional[httpx.Client] = None,
+        cache_size: int = 0,
+        cache_ttl: Optional[float] = None,
+        compress_requests: bool = False,
     ):
         """Initialize the Zaban client.
 
@@ -87,6 +94,15 @@ class Zaban:
             base_url: Base URL for the Zaban API. Defaults to localhost for development.
             timeout: Request timeout in seconds. Defaults to 30.0.
             max_retries: Maximum number of retries for failed requests. Defaults to 2.
+            http_client: Existing httpx client to reuse (e.g. one shared across the
+                    application). It is left open when this client is closed.
+            cache_size: Number of translation results to cache in memory, keyed by
+                    text, languages, auto_detect and domain. Defaults to 0 (disabled).
+            cache_ttl: Seconds a cached translation stays valid. Defaults to None
+                    (kept until evicted).
+            compress_requests: Gzip JSON request bodies larger than 1 KB, e.g. large
+                    batch translations. Only enable if the server accepts
+                    gzip-encoded requests. Defaults to False.
 
         Raises:
             ValueError: If API key is not provided and not found in environment variables.
@@ -104,10 +120,13 @@ class Zaban:
             base_url=base_url,
             timeout=timeout,
             max_retries=max_retries,
+            http_client=http_client,
+            compress_requests=compress_requests,
         )
 
         # Initialize resources
-        self.translation = Translation(self._client)
+        cache = TTLCache(max_size=cache_size, ttl=cache_ttl) if cache_size > 0 else None
+        self.translation = Translation(self._client, cache=cache)
         self.audio = Audio(self._client)
         self.transliteration = Transliteration(self._client)
 
@@ -189,6 +208,10 @@ class AsyncZaban:
         base_url: str = "http://localhost:8000/api/v1",
         timeout: float = 30.0,
         max_retries: int = 2,
+        http_client: Optional[httpx.AsyncClient] = None,
+        cache_size: int = 0,
+        cache_ttl: Optional[float] = None,
+        compress_requests: bool = False,
     ):
         """Initialize the async Zaban client.
 
@@ -198,6 +221,15 @@ class AsyncZaban:
             base_url: Base URL for the Zaban API. Defaults to localhost for development.
             timeout: Request timeout in seconds. Defaults to 30.0.
             max_retries: Maximum number of retries for failed requests. Defaults to 2.
+            http_client: Existing httpx client to reuse (e.g. one shared across the
+                    application). It is left open when this client is closed.
+            cache_size: Number of translation results to cache in memory, keyed by
+                    text, languages, auto_detect and domain. Defaults to 0 (disabled).
+            cache_ttl: Seconds a cached translation stays valid. Defaults to None
+                    (kept until evicted).
+            compress_requests: Gzip JSON request bodies larger than 1 KB, e.g. large
+                    batch translations. Only enable if the server accepts
+                    gzip-encoded requests. Defaults to False.
 
         Raises:
             ValueError: If API key is not provided and not found in environment variables.
@@ -215,10 +247,13 @@ class AsyncZaban:
             base_url=base_url,
             timeout=timeout,
             max_retries=max_retries,
+            http_client=http_client,
+            compress_requests=compress_requests,
         )
 
         # Initialize async resources
-        self.translation = AsyncTranslation(self._client)
+        cache = AsyncTTLCache(max_size=cache_size, ttl=cache_ttl) if cache_size > 0 else None
+        self.translation = AsyncTranslation(self._client, cache=cache)
         self.audio = AsyncAudio(self._client)
         self.transliteration = AsyncTransliteration(self._client)
 
@@ -226,6 +261,10 @@ class AsyncZaban:
         """Close the HTTP client and release resources."""
         await self._client.close()
 
+    async def aclose(self) -> None:
+        """Alias of close(), matching httpx naming."""
+        await self.close()
+
     async def __aenter__(self):
         """Async context manager entry."""
         return self
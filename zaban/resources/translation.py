@@ -1,23 +1,124 @@
 """Translation resource for Zaban API."""
 
-from typing import TYPE_CHECKING, Optional
+import asyncio
+import functools
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Sequence, Tuple, Union
 
-from ..types.translation import TranslationRequest, TranslationResponse
+from .._cache import AsyncTTLCache, TTLCache, text_key
+from .._exceptions import APIError
+from ..types.translation import (
+    BatchTranslationRequest,
+    BatchTranslationResponse,
+    LanguageDetectionRequest,
+    LanguageDetectionResponse,
+    TranslationRequest,
+    TranslationResponse,
+)
 
 if TYPE_CHECKING:
     from .._client import AsyncBaseClient, BaseClient
 
+BatchItem = Union[TranslationRequest, Tuple[str, str]]
+
+
+def _cache_key(request: TranslationRequest) -> Hashable:
+    """Build the cache key identifying a translation request."""
+    return (
+        text_key(request.text),
+        request.source_lang,
+        request.target_lang,
+        request.auto_detect,
+        request.domain,
+    )
+
+
+def _build_requests(
+    items: Sequence[BatchItem],
+    *,
+    source_lang: Optional[str],
+    auto_detect: bool,
+    domain: Optional[str],
+) -> List[TranslationRequest]:
+    """Build translation requests from requests and ``(text, target_lang)`` pairs.
+
+    Shared options only apply to pairs; ``TranslationRequest`` items are sent as-is.
+    """
+    requests = []
+    for item in items:
+        if not isinstance(item, TranslationRequest):
+            text, target_lang = item
+            item = TranslationRequest(
+                text=text,
+                source_lang=source_lang,
+                target_lang=target_lang,
+                domain=domain,
+                auto_detect=auto_detect,
+            )
+        requests.append(item)
+    return requests
+
+
+def _parse_batch_response(
+    response_data: Dict[str, Any], expected: int
+) -> List[TranslationResponse]:
+    """Parse a batch response, checking it has one result per request item."""
+    results = BatchTranslationResponse(**response_data).results
+    if len(results) != expected:
+        raise APIError(f"Batch response has {len(results)} results for {expected} items")
+    return results
+
+
+def _resolve_reserved(
+    reserved: Dict[Hashable, "asyncio.Future[TranslationResponse]"],
+    task: "asyncio.Future[List[TranslationResponse]]",
+) -> None:
+    """Resolve futures reserved for a batch from the finished batch task."""
+    if task.cancelled():
+        for future in reserved.values():
+            future.cancel()
+        return
+
+    error = task.exception()
+    for index, future in enumerate(reserved.values()):
+        if future.done():
+            continue
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(task.result()[index])
+
+
+def _cancel_when_unused(
+    task: "asyncio.Future[List[TranslationResponse]]",
+    reserved: Dict[Hashable, "asyncio.Future[TranslationResponse]"],
+    cache: AsyncTTLCache,
+) -> None:
+    """Cancel a batch task whose caller is gone once no one waits on its results."""
+    for future in reserved.values():
+        if not cache.waiting(future):
+            future.cancel()
+
+    def cancel_if_unused(_: Any = None) -> None:
+        if all(future.done() for future in reserved.values()):
+            task.cancel()
+
+    cancel_if_unused()
+    for future in reserved.values():
+        future.add_done_callback(cancel_if_unused)
+
 
 class Translation:
     """Translation resource for sync client."""
 
-    def __init__(self, client: "BaseClient"):
+    def __init__(self, client: "BaseClient", cache: Optional[TTLCache] = None):
         """Initialize translation resource.
 
         Args:
             client: Base HTTP client
+            cache: Cache for translation results (optional)
         """
         self._client = client
+        self._cache = cache
 
     def create(
         self,
@@ -66,6 +167,18 @@ class Translation:
             auto_detect=auto_detect,
         )
 
+        if self._cache is None:
+            return self._send(request)
+
+        key = _cache_key(request)
+        result = self._cache.get(key)
+        if result is None:
+            result = self._send(request)
+            self._cache.set(key, result)
+        return result
+
+    def _send(self, request: TranslationRequest) -> TranslationResponse:
+        """Send a single translation request."""
         response_data = self._client.request(
             method="POST",
             path="/translate",
@@ -74,6 +187,117 @@ class Translation:
 
         return TranslationResponse(**response_data)
 
+    def create_batch(
+        self,
+        items: Sequence[BatchItem],
+        *,
+        source_lang: Optional[str] = None,
+        auto_detect: bool = False,
+        domain: Optional[str] = None,
+    ) -> List[TranslationResponse]:
+        """Translate many texts in a single request.
+
+        Identical items are only sent once, and results already in the client
+        cache are reused instead of being sent again.
+
+        Args:
+            items: ``(text, target_lang)`` pairs or ``TranslationRequest`` objects
+            source_lang: Source language code applied to every pair (optional)
+            auto_detect: Enable automatic source language detection for every pair
+            domain: Translation domain applied to every pair (optional)
+
+        Returns:
+            List of TranslationResponse, in the same order as ``items``
+
+        Example:
+            ```python
+            results = client.translation.create_batch(
+                [("Hello", "hin_Deva"), ("Hello", "tam_Taml")],
+                auto_detect=True
+            )
+            for result in results:
+                print(result.translated_text)
+            ```
+        """
+        requests = _build_requests(
+            items, source_lang=source_lang, auto_detect=auto_detect, domain=domain
+        )
+        keys = [_cache_key(request) for request in requests]
+
+        results: Dict[Hashable, TranslationResponse] = {}
+        if self._cache is not None:
+            for key in keys:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    results[key] = cached
+
+        # Send each distinct, uncached request once
+        pending = {key: request for key, request in zip(keys, requests) if key not in results}
+        if pending:
+            for key, response in zip(pending, self._send_batch(list(pending.values()))):
+                results[key] = response
+                if self._cache is not None:
+                    self._cache.set(key, response)
+
+        return [results[key] for key in keys]
+
+    def _send_batch(self, requests: List[TranslationRequest]) -> List[TranslationResponse]:
+        """Send a batch translation request."""
+        request = BatchTranslationRequest(items=requests)
+
+        response_data = self._client.request(
+            method="POST",
+            path="/translate/batch",
+            json=request.model_dump(exclude_none=True),
+        )
+
+        return _parse_batch_response(response_data, len(requests))
+
+    def detect(self, text: str) -> LanguageDetectionResponse:
+        """Detect the language of text.
+
+        Detect once and pass the result as ``source_lang`` when translating
+        the same text to several languages, instead of using ``auto_detect``
+        on every request. Results are cached when the client cache is enabled.
+
+        Args:
+            text: Text whose language should be detected
+
+        Returns:
+            LanguageDetectionResponse with the detected language code
+
+        Example:
+            ```python
+            detection = client.translation.detect("Hello, how are you?")
+            result = client.translation.create(
+                text="Hello, how are you?",
+                source_lang=detection.source_lang,
+                target_lang="hin_Deva"
+            )
+            ```
+        """
+        if self._cache is None:
+            return self._send_detect(text)
+
+        key = ("detect", text_key(text))
+        result = self._cache.get(key)
+        if result is None:
+            result = self._send_detect(text)
+            self._cache.set(key, result)
+        return result
+
+    def _send_detect(self, text: str) -> LanguageDetectionResponse:
+        """Send a language detection request."""
+        request = LanguageDetectionRequest(text=text)
+
+        response_data = self._client.request(
+            method="POST",
+            path="/detect",
+            json=request.model_dump(),
+        )
+
+        return LanguageDetectionResponse(**response_data)
+
     def translate(
         self,
         text: str,
@@ -113,13 +337,15 @@ class Translation:
 class AsyncTranslation:
     """Translation resource for async client."""
 
-    def __init__(self, client: "AsyncBaseClient"):
+    def __init__(self, client: "AsyncBaseClient", cache: Optional[AsyncTTLCache] = None):
         """Initialize async translation resource.
 
         Args:
             client: Async base HTTP client
+            cache: Cache for translation results (optional)
         """
         self._client = client
+        self._cache = cache
 
     async def create(
         self,
@@ -159,6 +385,13 @@ class AsyncTranslation:
             auto_detect=auto_detect,
         )
 
+        if self._cache is None:
+            return await self._send(request)
+
+        return await self._cache.get_or_create(_cache_key(request), lambda: self._send(request))
+
+    async def _send(self, request: TranslationRequest) -> TranslationResponse:
+        """Send a single translation request."""
         response_data = await self._client.request(
             method="POST",
             path="/translate",
@@ -167,6 +400,114 @@ class AsyncTranslation:
 
         return TranslationResponse(**response_data)
 
+    async def create_batch(
+        self,
+        items: Sequence[BatchItem],
+        *,
+        source_lang: Optional[str] = None,
+        auto_detect: bool = False,
+        domain: Optional[str] = None,
+    ) -> List[TranslationResponse]:
+        """Translate many texts in a single request (async).
+
+        Identical items are only sent once, and results already in the client
+        cache are reused instead of being sent again.
+
+        Args:
+            items: ``(text, target_lang)`` pairs or ``TranslationRequest`` objects
+            source_lang: Source language code applied to every pair (optional)
+            auto_detect: Enable automatic source language detection for every pair
+            domain: Translation domain applied to every pair (optional)
+
+        Returns:
+            List of TranslationResponse, in the same order as ``items``
+        """
+        requests = _build_requests(
+            items, source_lang=source_lang, auto_detect=auto_detect, domain=domain
+        )
+        keys = [_cache_key(request) for request in requests]
+
+        # Cached or in-flight results from earlier calls
+        shared: Dict[Hashable, asyncio.Future[TranslationResponse]] = {}
+        if self._cache is not None:
+            for key in keys:
+                entry = self._cache.get(key)
+                if entry is not None:
+                    shared[key] = entry
+
+        # Send each distinct, uncached request once
+        results: Dict[Hashable, TranslationResponse] = {}
+        pending = {key: request for key, request in zip(keys, requests) if key not in shared}
+        if pending:
+            send = self._send_batch(list(pending.values()))
+            if self._cache is not None:
+                reserved = {key: self._cache.reserve(key) for key in pending}
+                task = asyncio.ensure_future(send)
+                task.add_done_callback(functools.partial(_resolve_reserved, reserved))
+                try:
+                    # Shield so cancelling this caller doesn't cancel the request
+                    # other callers are waiting on through the cache
+                    responses = await asyncio.shield(task)
+                except asyncio.CancelledError:
+                    _cancel_when_unused(task, reserved, self._cache)
+                    raise
+            else:
+                responses = await send
+
+            results.update(zip(pending, responses))
+
+        if shared and self._cache is not None:
+            cache = self._cache
+            # Wait on all entries at once so each counts this caller as a waiter
+            values = await asyncio.gather(*[cache.wait(entry) for entry in shared.values()])
+            results.update(zip(shared, values))
+
+        return [results[key] for key in keys]
+
+    async def _send_batch(self, requests: List[TranslationRequest]) -> List[TranslationResponse]:
+        """Send a batch translation request."""
+        request = BatchTranslationRequest(items=requests)
+
+        response_data = await self._client.request(
+            method="POST",
+            path="/translate/batch",
+            json=request.model_dump(exclude_none=True),
+        )
+
+        return _parse_batch_response(response_data, len(requests))
+
+    async def detect(self, text: str) -> LanguageDetectionResponse:
+        """Detect the language of text (async).
+
+        Detect once and pass the result as ``source_lang`` when translating
+        the same text to several languages, instead of using ``auto_detect``
+        on every request. Results are cached when the client cache is enabled.
+
+        Args:
+            text: Text whose language should be detected
+
+        Returns:
+            LanguageDetectionResponse with the detected language code
+        """
+        if self._cache is None:
+            return await self._send_detect(text)
+
+        return await self._cache.get_or_create(
+            ("detect", text_key(text)), lambda: self._send_detect(text)
+        )
+
+    async def _send_detect(self, text: str) -> LanguageDetectionResponse:
+        """Send a language detection request."""
+        request = LanguageDetectionRequest(text=text)
+
+        response_data = await self._client.request(
+            method="POST",
+            path="/detect",
+            json=request.model_dump(),
+        )
+
+        return LanguageDetectionResponse(**response_data)
+
     async def translate(
         self,
         text: str,
@@ -2,7 +2,14 @@
 
 from .common import LanguageCode
 from .stt import STTRequest, STTResponse
-from .translation import TranslationRequest, TranslationResponse
+from .translation import (
+    BatchTranslationRequest,
+    BatchTranslationResponse,
+    LanguageDetectionRequest,
+    LanguageDetectionResponse,
+    TranslationRequest,
+    TranslationResponse,
+)
 from .transliteration import Script, TransliterationRequest, TransliterationResponse
 from .tts import AudioFormat, Speaker, TTSRequest, TTSResponse
 
@@ -10,6 +17,10 @@ __all__ = [
     "LanguageCode",
     "TranslationRequest",
     "TranslationResponse",
+    "BatchTranslationRequest",
+    "BatchTranslationResponse",
+    "LanguageDetectionRequest",
+    "LanguageDetectionResponse",
     "TTSRequest",
     "TTSResponse",
     "AudioFormat",
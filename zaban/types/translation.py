@@ -1,6 +1,6 @@
 """Translation type definitions."""
 
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -33,3 +33,36 @@ class TranslationResponse(BaseModel):
     def __str__(self) -> str:
         """Return the translated text when converting to string."""
         return self.translated_text
+
+
+class BatchTranslationRequest(BaseModel):
+    """Request model for batch translation."""
+
+    items: List[TranslationRequest] = Field(
+        ..., description="Translation requests to process in a single call"
+    )
+
+
+class BatchTranslationResponse(BaseModel):
+    """Response model for batch translation."""
+
+    results: List[TranslationResponse] = Field(
+        ..., description="Translation results, in the same order as the request items"
+    )
+
+
+class LanguageDetectionRequest(BaseModel):
+    """Request model for source language detection."""
+
+    text: str = Field(..., description="Text whose language should be detected")
+
+
+class LanguageDetectionResponse(BaseModel):
+    """Response model for source language detection."""
+
+    source_lang: str = Field(..., description="Detected language code (e.g., 'eng_Latn')")
+    confidence: Optional[float] = Field(None, description="Detection confidence (0 to 1)")
+
+    def __str__(self) -> str:
+        """Return the detected language code when converting to string."""
+        return self.source_lang